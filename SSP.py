@@ -4,8 +4,12 @@ import hashlib
 import threading
 import os
 import calendar
+import heapq
 import requests
-from datetime import datetime, timedelta
+from array import array
+from functools import lru_cache
+import tkinter as tk
+from datetime import date, datetime, timedelta
 from tkinter import messagebox
 
 DATA_FILE = "users.json"
@@ -17,6 +21,85 @@ USERDATA_PATH = os.path.join(BASE_DIR, USERDATA_DIR)
 OPENAI_API_KEY = 'openAI-API-key'
 API_URL = 'https://api.openai.com/v1/chat/completions'
 
+REMOTE_HOLIDAYS = {}
+
+# Each rule is (name, kind, args, options). Kinds: "fixed" (month, day), "nth" (month, weekday, n; n=-1 is last),
+# "easter" (offset in days), "on_or_after" (month, day, weekday). Options: "substitute" is "observed" (add the
+# next free weekday when it falls on a weekend) or "moved" (the holiday itself moves to Monday); "since" is a first year.
+# Not computable from rules, so left out: VIC AFL Grand Final Friday (set each year), QLD Royal Queensland Show
+# (Brisbane only), part-day Christmas Eve and New Year's Eve (SA, NT), and one-off proclaimed days.
+HOLIDAY_RULES = {
+    "AU": [
+        ("New Year's Day", "fixed", (1, 1), {"substitute": "observed"}),
+        ("Australia Day", "fixed", (1, 26), {"substitute": "moved"}),
+        ("Good Friday", "easter", -2, {}),
+        ("Easter Monday", "easter", 1, {}),
+        ("Anzac Day", "fixed", (4, 25), {}),
+        ("Christmas Day", "fixed", (12, 25), {"substitute": "observed"}),
+        ("Boxing Day", "fixed", (12, 26), {"substitute": "observed"}),
+    ],
+    "AU-ACT": [
+        ("Canberra Day", "nth", (3, 0, 2), {}),
+        ("Easter Saturday", "easter", -1, {}),
+        ("Easter Sunday", "easter", 0, {}),
+        ("Reconciliation Day", "on_or_after", (5, 27, 0), {"since": 2018}),
+        ("{monarch}'s Birthday", "nth", (6, 0, 2), {}),
+        ("Labour Day", "nth", (10, 0, 1), {}),
+    ],
+    "AU-NSW": [
+        ("Easter Saturday", "easter", -1, {}),
+        ("Easter Sunday", "easter", 0, {}),
+        ("{monarch}'s Birthday", "nth", (6, 0, 2), {}),
+        ("Labour Day", "nth", (10, 0, 1), {}),
+    ],
+    "AU-NT": [
+        ("Easter Saturday", "easter", -1, {}),
+        ("May Day", "nth", (5, 0, 1), {}),
+        ("{monarch}'s Birthday", "nth", (6, 0, 2), {}),
+        ("Picnic Day", "nth", (8, 0, 1), {}),
+    ],
+    "AU-QLD": [
+        ("Easter Saturday", "easter", -1, {}),
+        ("Easter Sunday", "easter", 0, {}),
+        ("Labour Day", "nth", (5, 0, 1), {}),
+        ("{monarch}'s Birthday", "nth", (10, 0, 1), {}),
+    ],
+    "AU-SA": [
+        ("Adelaide Cup Day", "nth", (3, 0, 2), {}),
+        ("Easter Saturday", "easter", -1, {}),
+        ("Easter Sunday", "easter", 0, {"since": 2024}),
+        ("{monarch}'s Birthday", "nth", (6, 0, 2), {}),
+        ("Labour Day", "nth", (10, 0, 1), {}),
+    ],
+    "AU-TAS": [
+        ("Eight Hours Day", "nth", (3, 0, 2), {}),
+        ("{monarch}'s Birthday", "nth", (6, 0, 2), {}),
+    ],
+    "AU-VIC": [
+        ("Labour Day", "nth", (3, 0, 2), {}),
+        ("Easter Saturday", "easter", -1, {}),
+        ("Easter Sunday", "easter", 0, {}),
+        ("{monarch}'s Birthday", "nth", (6, 0, 2), {}),
+        ("Melbourne Cup Day", "nth", (11, 1, 1), {}),
+    ],
+    "AU-WA": [
+        ("Labour Day", "nth", (3, 0, 1), {}),
+        ("Easter Sunday", "easter", 0, {}),
+        ("Anzac Day", "fixed", (4, 25), {"substitute": "observed"}),
+        ("Western Australia Day", "nth", (6, 0, 1), {}),
+        ("{monarch}'s Birthday", "nth", (9, 0, -1), {}),
+    ],
+}
+HOLIDAY_REGIONS = list(HOLIDAY_RULES)
+
+REMINDER_WINDOW_DAYS = 7
+REMINDER_LEAD = timedelta(minutes=5)
+
+YEAR_CELL = 22
+YEAR_LEFT = 44
+YEAR_TOP = 24
+YEAR_HEAT_COLORS = [(0, "#f0f4f8"), (1, "#c7e0f4"), (2, "#8bc6ec"), (4, "#60a5fa"), (6, "#2563eb")]
+
 def ensure_userdata_dir():
     """Ensure the user_data directory exists."""
     if not os.path.exists(USERDATA_PATH):
@@ -52,6 +135,78 @@ def save_user_tasks(username, tasks):
     with open(path, "w") as f:
         json.dump(tasks, f, indent=2)
 
+def parse_task_key(key):
+    """Split a 'Y-M-D' or 'Y-M-D-H' task key into (date, hour); hour is None for all-day keys."""
+    parts = key.split('-')
+    if len(parts) not in (3, 4):
+        return None
+    try:
+        nums = [int(p) for p in parts]
+        day = datetime(nums[0], nums[1], nums[2]).date()
+    except ValueError:
+        return None
+    return day, (nums[3] if len(nums) == 4 else None)
+
+def easter_sunday(year):
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+def holiday_rule_date(year, kind, args):
+    if kind == "fixed":
+        return date(year, *args)
+    if kind == "easter":
+        return easter_sunday(year) + timedelta(days=args)
+    if kind == "on_or_after":
+        month, day, weekday = args
+        start = date(year, month, day)
+        return start + timedelta(days=(weekday - start.weekday()) % 7)
+    if kind == "nth":
+        month, weekday, n = args
+        if n > 0:
+            first = date(year, month, 1)
+            return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+        last = date(year, month, calendar.monthrange(year, month)[1])
+        return last - timedelta(days=(last.weekday() - weekday) % 7 + 7 * (-n - 1))
+    raise ValueError(f"Unknown holiday rule kind: {kind}")
+
+@lru_cache(maxsize=None)
+def local_holidays(region, year):
+    """Rule-based holidays for a region such as 'AU' or 'AU-VIC', keyed by (year, month, day).
+
+    The result is cached and shared, so callers must copy it before modifying it.
+    """
+    country = region.split("-")[0]
+    rules = HOLIDAY_RULES.get(country, []) + (HOLIDAY_RULES.get(region, []) if region != country else [])
+    monarch = "King" if year >= 2023 else "Queen"
+    found = []
+    for name, kind, args, options in rules:
+        if year < options.get("since", year):
+            continue
+        d = holiday_rule_date(year, kind, args)
+        substitute = options.get("substitute")
+        if substitute == "moved" and d.weekday() >= 5:
+            d += timedelta(days=7 - d.weekday())
+        found.append((d, name.format(monarch=monarch), substitute))
+
+    holidays = {(d.year, d.month, d.day): name for d, name, _ in found}
+    for d, name, substitute in sorted(found, key=lambda item: item[0]):
+        if substitute != "observed" or d.weekday() < 5:
+            continue
+        sub = d + timedelta(days=1)
+        while sub.weekday() >= 5 or (sub.year, sub.month, sub.day) in holidays:
+            sub += timedelta(days=1)
+        holidays[(sub.year, sub.month, sub.day)] = f"{name} (observed)"
+    return holidays
+
 def load_users():
     if not os.path.exists(DATA_FILE):
         return {}
@@ -188,6 +343,238 @@ class AuthApp(ctk.CTk):
         root.mainloop()
 
 
+class TaskAnalytics:
+    """Columnar per-day and per-hour task totals, kept in sync with the task store."""
+
+    def __init__(self, tasks):
+        self.slots = {}
+        self.base = None
+        self.day_totals = array("l")
+        self.hour_totals = array("l", [0] * 24)
+        for key, slot_tasks in tasks.items():
+            self.update_key(key, slot_tasks)
+
+    def update_key(self, key, tasks):
+        old = self.slots.pop(key, None)
+        if old is not None:
+            self._add(old[0], old[1], -old[2])
+        parsed = parse_task_key(key)
+        if parsed is None or not tasks:
+            return
+        ordinal, hour = parsed[0].toordinal(), parsed[1]
+        self.slots[key] = (ordinal, hour, len(tasks))
+        self._add(ordinal, hour, len(tasks))
+
+    def _add(self, ordinal, hour, delta):
+        if self.base is None:
+            self.base = ordinal
+        if ordinal < self.base:
+            self.day_totals[0:0] = array("l", [0] * (self.base - ordinal))
+            self.base = ordinal
+        idx = ordinal - self.base
+        if idx >= len(self.day_totals):
+            self.day_totals.extend([0] * (idx + 1 - len(self.day_totals)))
+        self.day_totals[idx] += delta
+        if hour is not None and 0 <= hour < 24:
+            self.hour_totals[hour] += delta
+
+    def _active(self):
+        return bytes(map(bool, self.day_totals))
+
+    def day_total(self, day):
+        if self.base is None:
+            return 0
+        idx = day.toordinal() - self.base
+        return self.day_totals[idx] if 0 <= idx < len(self.day_totals) else 0
+
+    def week_total(self, week_start):
+        if self.base is None:
+            return 0
+        start = max(week_start.toordinal() - self.base, 0)
+        end = max(week_start.toordinal() + 7 - self.base, 0)
+        return sum(self.day_totals[start:end])
+
+    def average_week_load(self):
+        if self.base is None:
+            return 0.0
+        weeks = max(len(self.day_totals) / 7, 1)
+        return sum(self.day_totals) / weeks
+
+    def busiest_hours(self, n=3):
+        ranked = sorted(range(24), key=self.hour_totals.__getitem__, reverse=True)
+        return [(h, self.hour_totals[h]) for h in ranked[:n] if self.hour_totals[h]]
+
+    def longest_streak(self):
+        if self.base is None:
+            return 0
+        return max(map(len, self._active().split(b"\x00")))
+
+    def current_streak(self, today):
+        if self.base is None:
+            return 0
+        idx = today.toordinal() - self.base
+        if idx < 0 or idx >= len(self.day_totals):
+            return 0
+        active = self._active()[:idx + 1]
+        return len(active) - len(active.rstrip(b"\x01"))
+
+    def idle_days_before(self, day):
+        """Number of task-free days directly before `day`, counted back to the last day with tasks."""
+        if self.base is None:
+            return None
+        idx = day.toordinal() - self.base
+        last = self._active().rfind(b"\x01", 0, max(idx, 0))
+        if last < 0:
+            return None
+        return idx - last - 1
+
+
+class FreeSlotIndex:
+    """Occupancy bitset over hourly slots; bit i is hour i after midnight of `start`."""
+
+    def __init__(self, slots, holidays, start, end):
+        self.start = datetime(start.year, start.month, start.day)
+        self.days = max((end.date() - self.start.date()).days, 0)
+        size = self.days * 24
+        base = self.start.toordinal()
+        occupied = (1 << max(int((start - self.start).total_seconds() // 3600) + 1, 0)) - 1
+        for ordinal, hour, _ in slots:
+            if hour is not None:
+                idx = (ordinal - base) * 24 + hour
+                if 0 <= idx < size:
+                    occupied |= 1 << idx
+        for y, m, d in holidays:
+            idx = (datetime(y, m, d).toordinal() - base) * 24
+            if 0 <= idx < size:
+                occupied |= 0xFFFFFF << idx
+        self.occupied = occupied & ((1 << size) - 1)
+
+    def free_mask(self, from_hour, to_hour):
+        day_mask = ((1 << to_hour) - 1) & ~((1 << from_hour) - 1)
+        repeat = ((1 << (24 * self.days)) - 1) // 0xFFFFFF
+        return day_mask * repeat & ~self.occupied
+
+    def plan(self, hours, from_hour, to_hour, per_day=None):
+        """Pick the earliest free slots, at most `per_day` each day; may return fewer than `hours`."""
+        free = self.free_mask(from_hour, to_hour)
+        picked = []
+        for day in range(self.days):
+            bits = (free >> (24 * day)) & 0xFFFFFF
+            taken = 0
+            while bits and len(picked) < hours and (per_day is None or taken < per_day):
+                low = bits & -bits
+                picked.append(self.start + timedelta(days=day, hours=low.bit_length() - 1))
+                bits ^= low
+                taken += 1
+            if len(picked) >= hours:
+                break
+        return picked
+
+
+class ReminderScheduler:
+    """Min-heap of upcoming hourly task times with at most one pending Tk `after` callback.
+
+    Reads the parsed slots kept by TaskAnalytics. Only slots inside a sliding window of
+    `window_days` sit in the heap; later ones wait in per-day buckets until the window reaches them.
+    """
+
+    def __init__(self, root, slots, on_due, window_days=REMINDER_WINDOW_DAYS):
+        self.root = root
+        self.slots = slots
+        self.on_due = on_due
+        self.window_days = window_days
+        self.heap = []
+        self.later = {}
+        self.scheduled = {}
+        self.reminded = {}
+        self.window_end = None
+        self.after_id = None
+        self.next_fire = None
+
+    def start(self):
+        """Build the heap from the task slots; called once, after the main window is up."""
+        now = datetime.now()
+        self.window_end = self._window_end_for(now)
+        for key, slot in self.slots.items():
+            self._push(key, slot, now)
+        self._reschedule()
+
+    def update_key(self, key):
+        """Pick up an edited slot; call after TaskAnalytics.update_key has run for it."""
+        if self.window_end is None:
+            return
+        slot = self.slots.get(key)
+        if slot is None:
+            self.scheduled.pop(key, None)
+        elif key not in self.scheduled and key not in self.reminded:
+            self._push(key, slot, datetime.now())
+        self._reschedule()
+
+    def stop(self):
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+        self.after_id = None
+        self.next_fire = None
+
+    def _window_end_for(self, now):
+        return datetime(now.year, now.month, now.day) + timedelta(days=self.window_days + 1)
+
+    def _push(self, key, slot, now):
+        ordinal, hour, _ = slot
+        if hour is None:
+            return
+        when = datetime.fromordinal(ordinal) + timedelta(hours=hour)
+        if when <= now:
+            return
+        self.scheduled[key] = when
+        if when < self.window_end:
+            heapq.heappush(self.heap, (when, key))
+        else:
+            self.later.setdefault(ordinal, []).append((when, key))
+
+    def _slide(self, now):
+        new_end = self._window_end_for(now)
+        for ordinal in range(self.window_end.toordinal(), new_end.toordinal()):
+            for when, key in self.later.pop(ordinal, []):
+                if self.scheduled.get(key) == when:
+                    heapq.heappush(self.heap, (when, key))
+        self.window_end = new_end
+
+    def _reschedule(self):
+        while self.heap and self.scheduled.get(self.heap[0][1]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+        if self.heap:
+            target = self.heap[0][0] - REMINDER_LEAD
+        elif self.later:
+            target = self.window_end - timedelta(days=self.window_days)
+        else:
+            target = None
+        if target == self.next_fire:
+            return
+        self.stop()
+        if target is not None:
+            delay = max(int((target - datetime.now()).total_seconds() * 1000), 0)
+            self.after_id = self.root.after(delay, self._fire)
+            self.next_fire = target
+
+    def _fire(self):
+        self.after_id = None
+        self.next_fire = None
+        now = datetime.now()
+        self._slide(now)
+        self.reminded = {key: when for key, when in self.reminded.items() if when > now}
+        due = []
+        while self.heap and self.heap[0][0] - REMINDER_LEAD <= now:
+            when, key = heapq.heappop(self.heap)
+            if self.scheduled.get(key) == when:
+                del self.scheduled[key]
+                self.reminded[key] = when
+                due.append(key)
+        if due:
+            self.on_due(due)
+        self._reschedule()
+
+
 class CustomCalendar:
     def __init__(self, root, username):
         self.root = root
@@ -202,35 +589,88 @@ class CustomCalendar:
         self.current_week_start = self.today - timedelta(days=self.today.weekday())
 
         self.tasks = load_user_tasks(self.username)
+        self.analytics = TaskAnalytics(self.tasks)
         self.holidays = {}
+        self.holiday_region = "AU"
+        self.year_canvas = None
+        self.year_cells = {}
 
         self.public_holidays(self.current_year)
         self.create_widgets()
 
+        self.reminders = ReminderScheduler(self.root, self.analytics.slots, self.show_reminders)
+        self.root.after(1000, self.reminders.start)
+
     def save_tasks(self):
         save_user_tasks(self.username, self.tasks)
 
-    def public_holidays(self, year, country_code="AU"):
-        self.holidays = {}
+    def set_slot_tasks(self, key, tasks):
+        self.tasks[key] = tasks
+        self.analytics.update_key(key, tasks)
+        self.reminders.update_key(key)
+
+    def clear_slot(self, key):
+        if self.tasks.pop(key, None) is not None:
+            self.analytics.update_key(key, [])
+            self.reminders.update_key(key)
+
+    def show_reminders(self, keys):
+        lines = []
+        for key in sorted(keys, key=parse_task_key):
+            day, hour = parse_task_key(key)
+            for t in self.tasks.get(key, []):
+                lines.append(f"{hour:02d}:00 ({day.strftime('%d %b')}) - {t}")
+        if lines:
+            self.root.bell()
+            ReminderPopup(self.root, lines)
+
+    def public_holidays(self, year, region=None):
+        region = region or self.holiday_region
+        self.holidays = dict(local_holidays(region, year))
+        country = region.split("-")[0]
+        if (country, year) in REMOTE_HOLIDAYS:
+            self.merge_remote_holidays(year, REMOTE_HOLIDAYS[(country, year)])
+        elif API_KEY != "holiday-API-key":
+            REMOTE_HOLIDAYS[(country, year)] = {}
+            threading.Thread(target=self.fetch_remote_holidays, args=(country, year), daemon=True).start()
+
+    def fetch_remote_holidays(self, country_code, year):
+        """Fetch national holidays from Calendarific to supplement the local rules."""
+        found = {}
         try:
             url = f"https://calendarific.com/api/v2/holidays?&api_key={API_KEY}&country={country_code}&year={year}"
-            response = requests.get(url)
+            response = requests.get(url, timeout=10)
             if response.status_code != 200:
                 print("Error fetching holidays: HTTP", response.status_code)
-                self.holidays = {}
                 return
             data = response.json()
             if "error" in data.get("meta", {}):
                 print("Calendarific API error:", data["meta"]["error_detail"])
-                self.holidays = {}
                 return
             for h in data.get("response", {}).get("holidays", []):
-                if h["type"][0] == "National holiday":
-                    d = datetime.strptime(h["date"]["iso"], "%Y-%m-%d")
-                    self.holidays[(d.year, d.month, d.day)] = h["name"]
+                if "National holiday" in h.get("type", []):
+                    d = datetime.strptime(h["date"]["iso"][:10], "%Y-%m-%d")
+                    found[(d.year, d.month, d.day)] = h["name"]
         except Exception as e:
             print("Failed to fetch holidays:", e)
-            self.holidays = {}
+        finally:
+            REMOTE_HOLIDAYS[(country_code, year)] = found
+            self.root.after(0, lambda: self.merge_remote_holidays(year, found, redraw=True))
+
+    def merge_remote_holidays(self, year, remote, redraw=False):
+        if year != self.current_year or not remote:
+            return
+        for key, name in remote.items():
+            self.holidays.setdefault(key, name)
+        if redraw:
+            self.redraw_calendar_grid()
+            self.update_sidebar_tasks()
+
+    def change_holiday_region(self, region):
+        self.holiday_region = region
+        self.public_holidays(self.current_year)
+        self.redraw_calendar_grid()
+        self.update_sidebar_tasks()
 
     def create_widgets(self):
         self.outmost = ctk.CTkFrame(self.root)
@@ -242,6 +682,9 @@ class CustomCalendar:
         ctk.CTkLabel(self.sidebar, text="📋 Saved Tasks", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=12)
         self.sidebar_taskbox = ctk.CTkTextbox(self.sidebar, width=210, height=600, state="disabled", wrap="word")
         self.sidebar_taskbox.pack(fill="both", expand=True, padx=8, pady=5)
+        ctk.CTkLabel(self.sidebar, text="📊 Workload Stats", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=(10, 4))
+        self.stats_box = ctk.CTkTextbox(self.sidebar, width=210, height=170, state="disabled", wrap="word")
+        self.stats_box.pack(fill="x", padx=8, pady=(0, 8))
 
         self.main_area = ctk.CTkFrame(self.outmost)
         self.main_area.pack(side="left", fill="both", expand=True)
@@ -271,6 +714,9 @@ class CustomCalendar:
         self.ai_btn = ctk.CTkButton(self.main_area, text="💬 AI Assistant", fg_color="#6366f1", text_color="white", command=self.open_ai_chat)
         self.ai_btn.pack(pady=4)
 
+        self.auto_btn = ctk.CTkButton(self.main_area, text="🗓️ Auto-Schedule", fg_color="#0ea5e9", text_color="white", command=self.open_auto_schedule)
+        self.auto_btn.pack(pady=4)
+
         self.header = ctk.CTkLabel(self.main_area, text="", font=ctk.CTkFont(size=20))
         self.header.pack(pady=8)
 
@@ -280,10 +726,19 @@ class CustomCalendar:
         ctk.CTkButton(nav_frame, text="← Prev", command=self.prev_month).pack(side="left", padx=10)
         ctk.CTkButton(nav_frame, text="Next →", command=self.next_month).pack(side="left", padx=10)
 
+        self.region_selector = ctk.CTkOptionMenu(
+            nav_frame,
+            values=HOLIDAY_REGIONS,
+            command=self.change_holiday_region,
+            width=100
+        )
+        self.region_selector.set(self.holiday_region)
+        self.region_selector.pack(side="left", padx=10)
+
         self.view_mode = ctk.StringVar(value="Month")
         self.view_selector = ctk.CTkOptionMenu(
             self.main_area,
-            values=["Day", "Week", "Month"],
+            values=["Day", "Week", "Month", "Year"],
             variable=self.view_mode,
             command=lambda _: self.redraw_calendar_grid()
         )
@@ -313,22 +768,176 @@ class CustomCalendar:
                 for t in tasks:
                     self.sidebar_taskbox.insert("end", f"  • {t}\n")
         self.sidebar_taskbox.configure(state="disabled")
+        self.update_stats_panel()
+
+    def update_stats_panel(self):
+        stats = self.analytics
+        today = self.today.date()
+        week_start = today - timedelta(days=today.weekday())
+        lines = [
+            f"This week: {stats.week_total(week_start)} tasks",
+            f"Avg per week: {stats.average_week_load():.1f}",
+            f"Current streak: {stats.current_streak(today)} days",
+            f"Longest streak: {stats.longest_streak()} days",
+        ]
+        busiest = stats.busiest_hours()
+        if busiest:
+            lines.append("Busiest hours: " + ", ".join(f"{h:02d}:00 ({c})" for h, c in busiest))
+        holidays = dict(local_holidays(self.holiday_region, today.year + 1))
+        holidays.update(local_holidays(self.holiday_region, today.year))
+        upcoming = sorted(k for k in holidays if date(*k) >= today)
+        if upcoming:
+            y, m, d = upcoming[0]
+            idle = stats.idle_days_before(date(y, m, d))
+            gap = "no tasks yet" if idle is None else f"{idle} idle days before"
+            lines.append(f"Next holiday: {holidays[upcoming[0]]} ({d} {calendar.month_abbr[m]}), {gap}")
+
+        self.stats_box.configure(state="normal")
+        self.stats_box.delete("1.0", "end")
+        self.stats_box.insert("end", "\n".join(lines))
+        self.stats_box.configure(state="disabled")
 
     def open_ai_chat(self):
         AIChatDialog(self.root)
 
+    def plan_study_blocks(self, hours, due, from_hour, to_hour, per_day=None):
+        now = datetime.now()
+        holidays = set(self.holidays)
+        for year in range(now.year, due.year + 1):
+            holidays.update(local_holidays(self.holiday_region, year))
+        index = FreeSlotIndex(self.analytics.slots.values(), holidays, now, due)
+        return index.plan(hours, from_hour, to_hour, per_day)
+
+    def open_auto_schedule(self):
+        dialog = AutoScheduleDialog(self.root, self.plan_study_blocks)
+        if not dialog.result:
+            return
+        title, slots = dialog.result
+        for slot in slots:
+            key = f"{slot.year}-{slot.month}-{slot.day}-{slot.hour}"
+            self.set_slot_tasks(key, self.tasks.get(key, []) + [title])
+        self.save_tasks()
+        self.redraw_calendar_grid()
+        self.update_sidebar_tasks()
+
     def get_day_task_count(self, year, month, day):
         day_tasks = len(self.tasks.get(f"{year}-{month}-{day}", []))
         hourly_tasks = sum(len(self.tasks.get(f"{year}-{month}-{day}-{h}", [])) for h in range(24))
         return day_tasks + hourly_tasks
 
+    def year_task_counts(self, year):
+        """Slice per-day task totals for a whole year out of the analytics columns."""
+        month_offsets = [0]
+        for m in range(1, 13):
+            month_offsets.append(month_offsets[-1] + calendar.monthrange(year, m)[1])
+        counts = [0] * month_offsets[12]
+        stats = self.analytics
+        if stats.base is not None:
+            start = datetime(year, 1, 1).toordinal() - stats.base
+            lo, hi = max(start, 0), min(start + len(counts), len(stats.day_totals))
+            if lo < hi:
+                counts[lo - start:hi - start] = stats.day_totals[lo:hi]
+        return counts, month_offsets
+
+    def draw_year_view(self):
+        self.header.configure(text=f"Year {self.current_year}")
+        canvas = self.year_canvas
+        if canvas is None or not canvas.winfo_exists():
+            canvas = tk.Canvas(
+                self.calendar_frame,
+                width=YEAR_LEFT + 31 * YEAR_CELL + 10,
+                height=YEAR_TOP + 12 * YEAR_CELL + 30,
+                bg="#ffffff",
+                highlightthickness=0
+            )
+            canvas.pack(pady=10)
+            for d in range(1, 32):
+                canvas.create_text(YEAR_LEFT + (d - 0.5) * YEAR_CELL, YEAR_TOP / 2, text=str(d), font=("Arial", 8))
+            self.year_cells = {}
+            for m in range(1, 13):
+                y0 = YEAR_TOP + (m - 1) * YEAR_CELL
+                canvas.create_text(YEAR_LEFT - 6, y0 + YEAR_CELL / 2, text=calendar.month_abbr[m], anchor="e", font=("Arial", 9))
+                for d in range(1, 32):
+                    x0 = YEAR_LEFT + (d - 1) * YEAR_CELL
+                    cell = canvas.create_rectangle(
+                        x0 + 1, y0 + 1, x0 + YEAR_CELL - 1, y0 + YEAR_CELL - 1, width=0
+                    )
+                    mark = canvas.create_polygon(
+                        x0 + YEAR_CELL - 9, y0 + 1, x0 + YEAR_CELL - 1, y0 + 1, x0 + YEAR_CELL - 1, y0 + 9,
+                        fill="#f59e0b", state="hidden"
+                    )
+                    self.year_cells[(m, d)] = (cell, mark)
+            self.year_status = canvas.create_text(
+                YEAR_LEFT, YEAR_TOP + 12 * YEAR_CELL + 15, text="", anchor="w", font=("Arial", 10)
+            )
+            canvas.bind("<Button-1>", self.on_year_click)
+            canvas.bind("<Motion>", self.on_year_motion)
+            self.year_canvas = canvas
+
+        counts, month_offsets = self.year_task_counts(self.current_year)
+        self.year_counts = counts
+        self.year_month_offsets = month_offsets
+        for (m, d), (item, mark) in self.year_cells.items():
+            if d > month_offsets[m] - month_offsets[m - 1]:
+                canvas.itemconfigure(item, state="hidden")
+                canvas.itemconfigure(mark, state="hidden")
+                continue
+            count = counts[month_offsets[m - 1] + d - 1]
+            is_today = (self.current_year, m, d) == (self.today.year, self.today.month, self.today.day)
+            color = next(c for threshold, c in reversed(YEAR_HEAT_COLORS) if count >= threshold)
+            canvas.itemconfigure(
+                item, state="normal", fill=color,
+                outline="#00c896" if is_today else "", width=2 if is_today else 0
+            )
+            canvas.itemconfigure(mark, state="normal" if (self.current_year, m, d) in self.holidays else "hidden")
+        canvas.itemconfigure(self.year_status, text=f"{sum(counts)} tasks in {self.current_year}")
+
+    def year_cell_at(self, x, y):
+        col = int((x - YEAR_LEFT) // YEAR_CELL)
+        row = int((y - YEAR_TOP) // YEAR_CELL)
+        if not (0 <= col < 31 and 0 <= row < 12):
+            return None
+        month, day = row + 1, col + 1
+        if day > calendar.monthrange(self.current_year, month)[1]:
+            return None
+        return month, day
+
+    def on_year_click(self, event):
+        cell = self.year_cell_at(event.x, event.y)
+        if cell is None:
+            return
+        self.current_month, self.current_day = cell
+        day_dt = datetime(self.current_year, self.current_month, self.current_day)
+        self.current_week_start = day_dt - timedelta(days=day_dt.weekday())
+        self.view_mode.set("Day")
+        self.redraw_calendar_grid()
+        self.update_sidebar_tasks()
+
+    def on_year_motion(self, event):
+        cell = self.year_cell_at(event.x, event.y)
+        if cell is None:
+            text = f"{sum(self.year_counts)} tasks in {self.current_year}"
+        else:
+            m, d = cell
+            count = self.year_counts[self.year_month_offsets[m - 1] + d - 1]
+            text = f"{d} {calendar.month_name[m]}: {count} tasks"
+            holiday_name = self.holidays.get((self.current_year, m, d))
+            if holiday_name:
+                text += f" 🎉 {holiday_name}"
+        self.year_canvas.itemconfigure(self.year_status, text=text)
+
     def redraw_calendar_grid(self):
+        view = self.view_mode.get()
+
         for widget in self.calendar_frame.winfo_children():
+            if view == "Year" and widget is self.year_canvas:
+                continue
             widget.destroy()
 
-        view = self.view_mode.get()
+        if view == "Year":
+            self.draw_year_view()
 
-        if view == "Month":
+        elif view == "Month":
             self.header.configure(text=f"{calendar.month_name[self.current_month]} {self.current_year}")
             days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
             for i, day in enumerate(days):
@@ -489,6 +1098,12 @@ class CustomCalendar:
             self.public_holidays(self.current_year)
             self.redraw_calendar_grid()
             self.update_sidebar_tasks()
+        elif view == "Year":
+            self.current_year -= 1
+            self.current_day = min(self.current_day, calendar.monthrange(self.current_year, self.current_month)[1])
+            self.public_holidays(self.current_year)
+            self.redraw_calendar_grid()
+            self.update_sidebar_tasks()
 
     def next_month(self):
         view = self.view_mode.get()
@@ -516,6 +1131,12 @@ class CustomCalendar:
             self.public_holidays(self.current_year)
             self.redraw_calendar_grid()
             self.update_sidebar_tasks()
+        elif view == "Year":
+            self.current_year += 1
+            self.current_day = min(self.current_day, calendar.monthrange(self.current_year, self.current_month)[1])
+            self.public_holidays(self.current_year)
+            self.redraw_calendar_grid()
+            self.update_sidebar_tasks()
 
     def on_day_click(self, day):
         self.show_day_tasks_dialog(self.current_year, self.current_month, day)
@@ -532,12 +1153,16 @@ class CustomCalendar:
         dialog = TaskDialog(self.root, f"Tasks for {day} {calendar.month_name[month]} {year}",
                             tasks, hourly_tasks, allow_add=True, holiday_name=holiday_name)
         if dialog.result is not None:
-            self.tasks[key] = dialog.result
+            self.set_slot_tasks(key, dialog.result)
+            by_hour = {}
+            for h, t in getattr(dialog, "result_hourly", []):
+                by_hour.setdefault(h, []).append(t)
             for h in range(24):
                 hour_key = f"{year}-{month}-{day}-{h}"
-                self.tasks.pop(hour_key, None)
-            for h, t in getattr(dialog, "result_hourly", []):
-                self.tasks.setdefault(f"{year}-{month}-{day}-{h}", []).append(t)
+                if h in by_hour:
+                    self.set_slot_tasks(hour_key, by_hour[h])
+                else:
+                    self.clear_slot(hour_key)
             self.save_tasks()
             self.redraw_calendar_grid()
             self.update_sidebar_tasks()
@@ -548,7 +1173,7 @@ class CustomCalendar:
         dialog = TaskDialog(self.root, f"Tasks at {hour:02d}:00 on {self.current_day} {calendar.month_name[self.current_month]}",
                             tasks, [], allow_add=True)
         if dialog.result is not None:
-            self.tasks[key] = dialog.result
+            self.set_slot_tasks(key, dialog.result)
             self.save_tasks()
             self.redraw_calendar_grid()
             self.update_sidebar_tasks()
@@ -659,6 +1284,126 @@ class TaskDialog(ctk.CTkToplevel):
         self.result_hourly = self.hourly_tasks
         self.destroy()
 
+class AutoScheduleDialog(ctk.CTkToplevel):
+    def __init__(self, parent, plan_fn):
+        super().__init__(parent)
+        self.title("Auto-Schedule Study Blocks")
+        self.geometry("420x560")
+        self.resizable(False, False)
+        self.plan_fn = plan_fn
+        self.result = None
+        self.preview = None
+        self.preview_goal = None
+
+        ctk.CTkLabel(self, text="Auto-Schedule Study Blocks", font=ctk.CTkFont(size=18, weight="bold")).pack(pady=10)
+
+        form = ctk.CTkFrame(self)
+        form.pack(fill="x", padx=10, pady=5)
+        self.entries = {}
+        fields = [
+            ("title", "Task", "e.g. COMP revision"),
+            ("hours", "Hours", "10"),
+            ("due", "Due date", "YYYY-MM-DD"),
+            ("from_hour", "From hour", "0-23"),
+            ("to_hour", "To hour", "1-24"),
+            ("per_day", "Max hours/day", "optional"),
+        ]
+        for row, (name, label, placeholder) in enumerate(fields):
+            ctk.CTkLabel(form, text=label, anchor="w").grid(row=row, column=0, sticky="w", padx=5, pady=3)
+            entry = ctk.CTkEntry(form, placeholder_text=placeholder, width=220)
+            entry.grid(row=row, column=1, padx=5, pady=3)
+            self.entries[name] = entry
+        self.entries["from_hour"].insert(0, "9")
+        self.entries["to_hour"].insert(0, "17")
+
+        self.error_label = ctk.CTkLabel(self, text="", text_color="red")
+        self.error_label.pack(pady=2)
+
+        self.preview_box = ctk.CTkTextbox(self, width=380, height=200, state="disabled", wrap="word")
+        self.preview_box.pack(fill="both", expand=True, padx=10, pady=5)
+
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.pack(pady=8)
+        ctk.CTkButton(btn_frame, text="Preview", command=self.run_preview).pack(side="left", padx=5)
+        ctk.CTkButton(btn_frame, text="Add to Calendar", fg_color="#22c55e", text_color="white",
+                      command=self.commit).pack(side="left", padx=5)
+        ctk.CTkButton(btn_frame, text="Cancel", command=self.destroy).pack(side="left", padx=5)
+
+        self.grab_set()
+        self.wait_window(self)
+
+    def read_goal(self):
+        values = {name: entry.get().strip() for name, entry in self.entries.items()}
+        if not values["title"]:
+            raise ValueError("Enter a task name.")
+        try:
+            hours = int(values["hours"])
+            due = datetime.strptime(values["due"], "%Y-%m-%d")
+            from_hour = int(values["from_hour"] or 9)
+            to_hour = int(values["to_hour"] or 17)
+            per_day = int(values["per_day"]) if values["per_day"] else None
+        except ValueError:
+            raise ValueError("Hours must be numbers and the due date YYYY-MM-DD.")
+        if hours <= 0 or not 0 <= from_hour < to_hour <= 24 or (per_day is not None and per_day <= 0):
+            raise ValueError("Check the hours and the allowed time range.")
+        if due <= datetime.now():
+            raise ValueError("Due date must be in the future.")
+        return values["title"], hours, due, from_hour, to_hour, per_day
+
+    def run_preview(self):
+        self.error_label.configure(text="")
+        try:
+            goal = self.read_goal()
+        except ValueError as e:
+            self.error_label.configure(text=str(e))
+            self.preview = None
+            self.preview_goal = None
+            return
+        title, hours, due, from_hour, to_hour, per_day = goal
+        slots = self.plan_fn(hours, due, from_hour, to_hour, per_day)
+        self.preview = (title, slots)
+        self.preview_goal = goal
+
+        self.preview_box.configure(state="normal")
+        self.preview_box.delete("1.0", "end")
+        if len(slots) < hours:
+            self.preview_box.insert("end", f"⚠️ Only {len(slots)} of {hours} free hours before the due date.\n\n")
+        for slot in slots:
+            self.preview_box.insert("end", f"{slot.strftime('%a %d %b %Y, %H:00')} - {title}\n")
+        self.preview_box.configure(state="disabled")
+
+    def commit(self):
+        try:
+            goal = self.read_goal()
+        except ValueError:
+            goal = None
+        if self.preview is None or goal != self.preview_goal:
+            changed = self.preview is not None
+            self.run_preview()
+            if self.preview is not None:
+                prefix = "Form changed - review" if changed else "Review"
+                self.error_label.configure(text=f"{prefix} the new preview, then click Add again.")
+            return
+        if not self.preview[1]:
+            self.error_label.configure(text="No free slots to add before the due date.")
+            return
+        self.result = self.preview
+        self.destroy()
+
+class ReminderPopup(ctk.CTkToplevel):
+    def __init__(self, parent, lines):
+        super().__init__(parent)
+        self.title("Study Reminder")
+        self.geometry("360x220")
+        self.attributes("-topmost", True)
+
+        ctk.CTkLabel(self, text="⏰ Coming up", font=ctk.CTkFont(size=18, weight="bold")).pack(pady=10)
+        textbox = ctk.CTkTextbox(self, width=330, height=110, wrap="word")
+        textbox.pack(fill="both", expand=True, padx=10)
+        textbox.insert("end", "\n".join(lines))
+        textbox.configure(state="disabled")
+        ctk.CTkButton(self, text="Dismiss", command=self.destroy).pack(pady=8)
+
 class AIChatDialog(ctk.CTkToplevel):
     def __init__(self, parent):
         super().__init__(parent)